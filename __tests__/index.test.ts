@@ -285,6 +285,27 @@ describe('loadConfig', () => {
     expect(result).toBeDefined();
   });
 
+  it('should check each config path at most once', async () => {
+    vi.mocked(existsSync).mockReset();
+    vi.mocked(existsSync).mockReturnValue(false);
+
+    const client = createMockClient();
+    await RateLimitFallback({
+      client: client as any,
+      directory: '/test',
+      project: {} as any,
+      worktree: '/test',
+      serverUrl: new URL('http://test.com'),
+      $: {} as any,
+    });
+
+    const configPathCalls = vi.mocked(existsSync).mock.calls
+      .map(([path]) => String(path))
+      .filter((path) => path.endsWith('rate-limit-fallback.json'));
+    expect(configPathCalls.length).toBeGreaterThan(0);
+    expect(new Set(configPathCalls).size).toBe(configPathCalls.length);
+  });
+
   it('should load custom config from project directory', async () => {
     const mockConfig = {
       fallbackModels: [
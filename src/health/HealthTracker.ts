@@ -279,11 +279,8 @@ export class HealthTracker {
    */
   private performSave(): void {
     try {
-      // Ensure directory exists
-      const dir = dirname(this.persistencePath);
-      if (!existsSync(dir)) {
-        mkdirSync(dir, { recursive: true });
-      }
+      // Ensure directory exists (recursive mkdir is a no-op when it already does)
+      mkdirSync(dirname(this.persistencePath), { recursive: true });
 
       const state: HealthTrackerState = {
         models: Object.fromEntries(this.healthData.entries()),
@@ -44,6 +44,18 @@ export const DEFAULT_CONFIG: PluginConfig = {
   errorPatterns: DEFAULT_ERROR_PATTERNS_CONFIG,
 };
 
+/**
+ * Example config shown when no config file is found (serialized once at load)
+ */
+const EXAMPLE_CONFIG_JSON = JSON.stringify({
+  fallbackModels: [
+    { providerID: "anthropic", modelID: "claude-3-5-sonnet-20250514" },
+  ],
+  cooldownMs: 60000,
+  enabled: true,
+  fallbackMode: "cycle",
+}, null, 2);
+
 /**
  * Validate that a path does not contain directory traversal attempts
  */
@@ -167,17 +179,27 @@ export function loadConfig(directory: string, worktree?: string, logger?: Logger
     configPaths.push(join(dir, "rate-limit-fallback.json"));
   }
 
+  // Stat each candidate at most once; the debug listing and the lookup share results
+  const existsCache = new Map<string, boolean>();
+  const exists = (configPath: string): boolean => {
+    let found = existsCache.get(configPath);
+    if (found === undefined) {
+      found = existsSync(configPath);
+      existsCache.set(configPath, found);
+    }
+    return found;
+  };
+
   // Log search paths for debugging
   if (logger) {
     logger.debug(`Searching for config file in ${configPaths.length} locations`);
     for (const configPath of configPaths) {
-      const exists = existsSync(configPath);
-      logger.debug(`  ${exists ? "✓" : "✗"} ${configPath}`);
+      logger.debug(`  ${exists(configPath) ? "✓" : "✗"} ${configPath}`);
     }
   }
 
   for (const configPath of configPaths) {
-    if (existsSync(configPath)) {
+    if (exists(configPath)) {
       if (logger) {
         logger.debug(`Found config file at: ${configPath}`);
       }
@@ -243,14 +265,7 @@ export function loadConfig(directory: string, worktree?: string, logger?: Logger
         logger.warn(`  - ${configPath}`);
       }
       logger.warn('Example config:');
-      logger.warn(JSON.stringify({
-        fallbackModels: [
-          { providerID: "anthropic", modelID: "claude-3-5-sonnet-20250514" },
-        ],
-        cooldownMs: 60000,
-        enabled: true,
-        fallbackMode: "cycle",
-      }, null, 2));
+      logger.warn(EXAMPLE_CONFIG_JSON);
     }
   }
   return { config: DEFAULT_CONFIG, source: null };